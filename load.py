@@ -4,12 +4,20 @@ Displays current radio program information from online radio stations
 """
 import tkinter as tk
 from tkinter import ttk
+import importlib
+import json
 import sys
 import os
+import textwrap
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from threading import Thread
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from threading import Lock
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 this = sys.modules[__name__]
 
@@ -23,23 +31,26 @@ try:
 except ImportError:
     nb = None
 
-# Try to import EDMCOverlay
-try:
-    edmc_overlay_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'EDMCOverlay')
-    if edmc_overlay_path not in sys.path:
-        sys.path.append(edmc_overlay_path)
-    from edmcoverlay import Overlay
-    OVERLAY_AVAILABLE = True
-except ImportError:
-    OVERLAY_AVAILABLE = False
-    Overlay = None
+# EDMCOverlay lives in a sibling plugin folder. Only probe for the
+# folder here; the actual import is deferred until the overlay is
+# first used so it doesn't slow down EDMC startup
+EDMC_OVERLAY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'EDMCOverlay')
+OVERLAY_AVAILABLE = os.path.isdir(EDMC_OVERLAY_PATH)
 
-# Add plugin directory to path for parser imports
+# Make the plugin directory (for parser imports) and the EDMCOverlay
+# folder importable, inserting whichever are missing in a single pass
 plugin_dir = os.path.dirname(os.path.abspath(__file__))
-if plugin_dir not in sys.path:
-    sys.path.insert(0, plugin_dir)
+_wanted_paths = [plugin_dir] + ([EDMC_OVERLAY_PATH] if OVERLAY_AVAILABLE else [])
+_known_paths = set(sys.path)
+sys.path[:0] = [p for p in _wanted_paths if p not in _known_paths]
+del _wanted_paths, _known_paths
 
-from parsers import ORFParser
+# Station types mapped to their parser (module, class). The module is
+# imported lazily on first fetch so plugin load stays cheap and future
+# parsers don't all get imported eagerly
+_PARSER_REGISTRY = {
+    "ORF Sound": ("parsers", "ORFParser")
+}
 
 # Configuration keys
 CFG_STATION_URL = "RadioProgramURL"
@@ -54,6 +65,9 @@ CFG_REFRESH_INTERVAL = "RadioProgramRefreshInterval"
 DEFAULT_URL = "https://audioapi.orf.at/oe1/api/json/current/broadcasts"
 DEFAULT_STATION_TYPE = "ORF Sound"
 DEFAULT_REFRESH_INTERVAL = 10  # minutes
+STALE_AFTER_SECONDS = 60  # data younger than this is served without a new fetch
+BACKOFF_CAP_SECONDS = 7200  # failure backoff may stretch beyond the longest refresh interval
+OVERLAY_RETRY_SECONDS = 3600  # how long overlay sends stay disabled after a failure
 DEFAULT_OVERLAY_POSITION = "top-left"
 DEFAULT_SCREEN_WIDTH = 1920
 DEFAULT_SCREEN_HEIGHT = 1080
@@ -70,6 +84,69 @@ OVERLAY_POSITIONS = {
     "bottom-right": (0.85, 0.75)    # 85% from left (adjusted), 75% from top (raised from 82%)
 }
 
+# Human-readable overlay position names and their display order,
+# built once instead of on every preferences open
+_POSITION_NAMES = {
+    "top-left": "Top Left",
+    "top-middle": "Top Middle",
+    "top-right": "Top Right",
+    "middle-left": "Middle Left",
+    "middle-right": "Middle Right",
+    "bottom-left": "Bottom Left",
+    "bottom-middle": "Bottom Middle",
+    "bottom-right": "Bottom Right"
+}
+_POSITION_VALUES = list(OVERLAY_POSITIONS)
+_POSITION_DISPLAY = [_POSITION_NAMES.get(p, p) for p in _POSITION_VALUES]
+
+# Default headers for the persistent HTTP session; compressed bodies
+# cut the broadcast payload to a fraction of its size on the wire
+_HTTP_HEADERS = {
+    'User-Agent': 'ED-RadioProgram/1.0 (EDMC Plugin)',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+# Fixed overlay framing, built once instead of per redraw
+_BOX_WIDTH = 400  # Fixed width for consistent look
+_TOP_BORDER = "╔" + "═" * 36 + "╗"
+_SEPARATOR = "║" + "─" * 36 + "║"
+
+# Per-line prefixes, interned once instead of rebuilt on every redraw
+_PREFIX_NAME = "║ 🎵 "
+_PREFIX_TIME = "║ ⏰ "
+_PREFIX_AUTHOR = "║ 🎙️ "
+_PREFIX_PLAIN = "║ "
+_BOTTOM_BORDER = "╚" + "═" * 36 + "╝"
+
+# (color, size) styles for the overlay entry kinds
+_STYLE_BORDER = ("#00FFFF", "normal")   # Cyan framing
+_STYLE_NAME = ("#00FFFF", "large")      # Cyan program name, LED-style
+_STYLE_TIME = ("#00FF00", "normal")     # Green digital-clock time slot
+_STYLE_AUTHOR = ("#FFA500", "normal")   # Orange presenter
+_STYLE_DESC = ("#FFFFFF", "normal")     # White description text
+
+# Horizontal anchor per overlay position, plus the box/text x-offsets
+# for each anchor. A direct lookup replaces the old substring tests on
+# the position name; the alignment per position is unchanged
+_ANCHOR = {
+    "top-left": "left",
+    "top-middle": "center",
+    "top-right": "right",
+    "middle-left": "left",
+    "middle-right": "right",
+    "bottom-left": "left",
+    "bottom-middle": "center",
+    "bottom-right": "right"
+}
+_ANCHOR_X_FN = {
+    "left": lambda overlay_x, box_width: (overlay_x, overlay_x + 10),
+    "center": lambda overlay_x, box_width: (overlay_x - (box_width // 2), overlay_x - (box_width // 2) + 10),
+    "right": lambda overlay_x, box_width: (overlay_x - box_width, overlay_x - box_width + 10)
+}
+
+# Derived overlay geometry for one (position, resolution) combination
+Layout = namedtuple('Layout', ['overlay_x', 'overlay_y', 'box_x', 'text_x'])
+
 # Common screen resolutions
 SCREEN_RESOLUTIONS = {
     "1920x1080 (Full HD)": (1920, 1080),
@@ -82,7 +159,31 @@ SCREEN_RESOLUTIONS = {
 
 class RadioProgramPlugin:
     """Main class for the ED-RadioProgram plugin"""
-    
+
+    # Fixed attribute set - drops the per-instance __dict__ and makes
+    # the attribute reads in update_overlay/update_display cheaper.
+    # Every name here is initialized in __init__
+    __slots__ = (
+        "station_url", "station_type", "overlay_enabled", "overlay_position",
+        "screen_width", "screen_height", "refresh_interval",
+        "program_data", "last_update", "_last_update_str",
+        "_cache_ts", "_fetch_error",
+        "refresh_timer", "_next_refresh_monotonic", "_restart_timer", "parent",
+        "_saved_snapshot", "_fetch_lock",
+        "_paused", "_visibility_bound", "_toplevel",
+        "parser", "_session",
+        "_etag", "_last_modified", "_cached_payload",
+        "_backoff",
+        "_last_payload_hash", "_last_overlay_draw", "_active_overlay_slots",
+        "_executor", "_fetch_pending",
+        "_label_state",
+        "status_label", "program_frame", "program_name_label",
+        "time_slot_label", "description_label", "author_label",
+        "refresh_button", "overlay_button",
+        "_pos_fn", "_layout_cache", "_wrappers",
+        "overlay_client", "_overlay_ok", "_overlay_dead_until"
+    )
+
     def __init__(self):
         self.station_url = DEFAULT_URL
         self.station_type = DEFAULT_STATION_TYPE
@@ -94,14 +195,71 @@ class RadioProgramPlugin:
         
         self.program_data = None
         self.last_update = None
+        self._last_update_str = ""
+
+        # Stale-while-revalidate state: when the last good fetch
+        # happened, and the error (if any) of the most recent attempt
+        self._cache_ts = 0.0
+        self._fetch_error = None
         self.refresh_timer = None
+        self._next_refresh_monotonic = 0.0
+        self._restart_timer = None
         self.parent = None
-        self.is_fetching = False
+
+        # Config values as last written, so save_config only touches
+        # keys that actually changed
+        self._saved_snapshot = {}
+        self._fetch_lock = Lock()
+
+        # Refresh pause state while the EDMC window is unmapped
+        self._paused = False
+        self._visibility_bound = False
+        self._toplevel = None
         
-        # Parser
-        self.parser = ORFParser()
+        # Parser, created lazily by _get_parser on first fetch
+        self.parser = None
+
+        # Persistent HTTP session - keep-alive reuses the TLS connection
+        # to the station API across refreshes
+        self._session = requests.Session()
+        self._session.headers.update(_HTTP_HEADERS)
+        # Pool sized so concurrent fetches against several station
+        # hosts could share keep-alive connections if more stations
+        # are ever configured at once
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        ))
+
+        # HTTP cache validators - a 304 response lets us skip the
+        # download and re-parse when the schedule hasn't changed
+        self._etag = None
+        self._last_modified = None
+        self._cached_payload = None
+
+        # Exponential backoff (seconds) after network failures so a
+        # stalled endpoint isn't hammered on every scheduled refresh
+        self._backoff = 0
+
+        # Hash of the last payload drawn on the overlay, so identical
+        # redraws are skipped before any line assembly
+        self._last_payload_hash = None
+        self._last_overlay_draw = 0
+
+        # Slot indices currently showing text, so clears only touch
+        # slots that were actually drawn
+        self._active_overlay_slots = set()
+
+        # One persistent executor thread services all refreshes instead
+        # of spawning a new thread per fetch
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="edradio")
+        self._fetch_pending = False
         
         # UI widgets
+        # Last options written per label (keyed by widget id), used by
+        # _set_label to skip no-op config() calls
+        self._label_state = {}
         self.status_label = None
         self.program_frame = None
         self.program_name_label = None
@@ -111,13 +269,27 @@ class RadioProgramPlugin:
         self.refresh_button = None
         self.overlay_button = None
         
-        # Initialize overlay if available
+        # Geometry function for the current overlay position, rebuilt
+        # only when the position changes
+        self._pos_fn = None
+        self._rebuild_position_cache()
+
+        # Memoized layouts keyed by (position, width, height)
+        self._layout_cache = {}
+
+        # One TextWrapper per wrap width, reused across redraws
+        self._wrappers = {}
+
+        # Overlay client is created lazily on first use; _overlay_ok
+        # starts as "plausible" (plugin folder present) and is cleared
+        # if the deferred import or connection fails
         self.overlay_client = None
-        if OVERLAY_AVAILABLE:
-            try:
-                self.overlay_client = Overlay()
-            except Exception as e:
-                print(f"ED-RadioProgram: Could not initialize overlay: {e}")
+        self._overlay_ok = OVERLAY_AVAILABLE
+
+        # After a failed send the overlay is considered dead until this
+        # monotonic time, so one broken socket costs one error instead
+        # of one per line on every refresh
+        self._overlay_dead_until = 0.0
 
     def load_config(self):
         """Load saved configuration"""
@@ -125,37 +297,107 @@ class RadioProgramPlugin:
         self.station_type = config.get(CFG_STATION_TYPE) or DEFAULT_STATION_TYPE
         self.overlay_enabled = config.get_bool(CFG_OVERLAY_ENABLED, default=True)
         self.overlay_position = config.get(CFG_OVERLAY_POSITION) or DEFAULT_OVERLAY_POSITION
-        
+
         # Load screen resolution
-        try:
-            self.screen_width = config.get_int(CFG_SCREEN_WIDTH) or DEFAULT_SCREEN_WIDTH
-            self.screen_height = config.get_int(CFG_SCREEN_HEIGHT) or DEFAULT_SCREEN_HEIGHT
-        except:
-            self.screen_width = DEFAULT_SCREEN_WIDTH
-            self.screen_height = DEFAULT_SCREEN_HEIGHT
-        
+        self.screen_width = config.get_int(CFG_SCREEN_WIDTH, default=DEFAULT_SCREEN_WIDTH) or DEFAULT_SCREEN_WIDTH
+        self.screen_height = config.get_int(CFG_SCREEN_HEIGHT, default=DEFAULT_SCREEN_HEIGHT) or DEFAULT_SCREEN_HEIGHT
+
         # Validate overlay position
         if self.overlay_position not in OVERLAY_POSITIONS:
             self.overlay_position = DEFAULT_OVERLAY_POSITION
-        
-        try:
-            interval = config.get_int(CFG_REFRESH_INTERVAL)
-            if interval and 5 <= interval <= 60:
-                self.refresh_interval = interval
-            else:
-                self.refresh_interval = DEFAULT_REFRESH_INTERVAL
-        except:
+
+        interval = config.get_int(CFG_REFRESH_INTERVAL, default=DEFAULT_REFRESH_INTERVAL)
+        if 5 <= interval <= 60:
+            self.refresh_interval = interval
+        else:
             self.refresh_interval = DEFAULT_REFRESH_INTERVAL
 
+        self._rebuild_position_cache()
+        self._saved_snapshot = self._config_snapshot()
+
+    def _get_parser(self):
+        """Import and instantiate the parser for the configured station type"""
+        if self.parser is None:
+            module_name, class_name = _PARSER_REGISTRY.get(
+                self.station_type, _PARSER_REGISTRY[DEFAULT_STATION_TYPE])
+            module = importlib.import_module(module_name)
+            self.parser = getattr(module, class_name)()
+        return self.parser
+
+    def _mark_overlay_dead(self, error):
+        """Pause overlay sends after a failure; re-probed after the retry window"""
+        print(f"ED-RadioProgram: Overlay unreachable, pausing sends: {error}")
+        self._overlay_dead_until = time.monotonic() + OVERLAY_RETRY_SECONDS
+        self.overlay_client = None
+
+    def _get_overlay(self):
+        """Import EDMCOverlay and connect on first use"""
+        if self.overlay_client is None and self._overlay_ok:
+            try:
+                from edmcoverlay import Overlay
+                self.overlay_client = Overlay()
+            except Exception as e:
+                print(f"ED-RadioProgram: Could not initialize overlay: {e}")
+                self._overlay_ok = False
+        return self.overlay_client
+
+    def _rebuild_position_cache(self):
+        """Look up box/text x-coordinate math for the current overlay position"""
+        anchor = _ANCHOR.get(self.overlay_position, "left")
+        self._pos_fn = _ANCHOR_X_FN[anchor]
+
+    def _get_layout(self):
+        """Return the overlay geometry, memoized per position and resolution"""
+        key = (self.overlay_position, self.screen_width, self.screen_height)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            pos_x_pct, pos_y_pct = OVERLAY_POSITIONS.get(
+                self.overlay_position, OVERLAY_POSITIONS[DEFAULT_OVERLAY_POSITION])
+            overlay_x = int(pos_x_pct * self.screen_width)
+            overlay_y = int(pos_y_pct * self.screen_height)
+            box_x, text_x = self._pos_fn(overlay_x, _BOX_WIDTH)
+            layout = Layout(overlay_x, overlay_y, box_x, text_x)
+            self._layout_cache[key] = layout
+        return layout
+
+    def _config_snapshot(self):
+        """Current config values, keyed the way they are stored"""
+        return {
+            CFG_STATION_URL: self.station_url,
+            CFG_STATION_TYPE: self.station_type,
+            CFG_OVERLAY_ENABLED: self.overlay_enabled,
+            CFG_OVERLAY_POSITION: self.overlay_position,
+            CFG_SCREEN_WIDTH: self.screen_width,
+            CFG_SCREEN_HEIGHT: self.screen_height,
+            CFG_REFRESH_INTERVAL: self.refresh_interval
+        }
+
     def save_config(self):
-        """Save configuration"""
-        config.set(CFG_STATION_URL, self.station_url)
-        config.set(CFG_STATION_TYPE, self.station_type)
-        config.set(CFG_OVERLAY_ENABLED, self.overlay_enabled)
-        config.set(CFG_OVERLAY_POSITION, self.overlay_position)
-        config.set(CFG_SCREEN_WIDTH, self.screen_width)
-        config.set(CFG_SCREEN_HEIGHT, self.screen_height)
-        config.set(CFG_REFRESH_INTERVAL, self.refresh_interval)
+        """Save configuration, writing only keys whose value changed"""
+        current = self._config_snapshot()
+        reschedule = False
+        for key, value in current.items():
+            if self._saved_snapshot.get(key) != value:
+                config.set(key, value)
+                if key in (CFG_REFRESH_INTERVAL, CFG_STATION_URL):
+                    reschedule = True
+        self._saved_snapshot = current
+        if reschedule:
+            self._debounce_restart()
+
+    def _debounce_restart(self):
+        """Restart the refresh scheduler once a burst of config saves settles"""
+        if self.parent is None:
+            return
+        if self._restart_timer:
+            self.parent.after_cancel(self._restart_timer)
+        self._restart_timer = self.parent.after(250, self._restart_refresh)
+
+    def _restart_refresh(self):
+        """Debounced tail of _debounce_restart"""
+        self._restart_timer = None
+        self.stop_refresh()
+        self.schedule_refresh()
 
     def toggle_overlay(self):
         """Toggle overlay on/off"""
@@ -184,318 +426,434 @@ class RadioProgramPlugin:
         """
         if not text or len(text) <= max_chars:
             return [text] if text else []
-        
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-        
-        for word in words:
-            word_length = len(word)
-            # +1 for space
-            if current_length + word_length + (1 if current_line else 0) <= max_chars:
-                current_line.append(word)
-                current_length += word_length + (1 if current_line else 0)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = word_length
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
+
+        # One TextWrapper per width, built on first use. Skipping
+        # break_on_hyphens selects the wrapper's simpler split regex.
+        wrapper = self._wrappers.get(max_chars)
+        if wrapper is None:
+            wrapper = textwrap.TextWrapper(
+                width=max_chars,
+                break_long_words=False,
+                break_on_hyphens=False,
+                drop_whitespace=True
+            )
+            self._wrappers[max_chars] = wrapper
+
+        return wrapper.wrap(text)
+
+    def _batch_send(self, messages):
+        """
+        Send a list of raw overlay payloads in as few writes as possible.
+
+        EDMCOverlay speaks newline-delimited JSON over a TCP socket; when
+        the client exposes its connection, the whole frame goes out in a
+        single sendall. Falls back to the per-message client API otherwise.
+        """
+        client = self.overlay_client
+        connection = getattr(client, 'connection', None)
+        if connection is None and hasattr(client, 'connect'):
+            try:
+                client.connect()
+                connection = getattr(client, 'connection', None)
+            except Exception:
+                connection = None
+
+        if connection is not None:
+            try:
+                payload = b"".join(json.dumps(m).encode('utf-8') + b"\n" for m in messages)
+                connection.sendall(payload)
+                return
+            except Exception as e:
+                print(f"ED-RadioProgram: Batched overlay send failed: {e}")
+
+        # Fall back to one client call per message
+        for m in messages:
+            try:
+                if 'shape' in m:
+                    client.send_shape(m['id'], m['shape'], m['color'], m['fill'],
+                                      m['x'], m['y'], m['w'], m['h'], ttl=m['ttl'])
+                else:
+                    client.send_message(m['id'], m['text'], m['color'],
+                                        m['x'], m['y'], ttl=m['ttl'],
+                                        size=m.get('size', 'normal'))
+            except Exception as e:
+                # One failure means the overlay process is gone; don't
+                # pay the socket error for every remaining line
+                self._mark_overlay_dead(e)
+                return
+
+    def _extract_fields(self, data):
+        """Unpack the displayed fields from a program data dict once"""
+        return (
+            data.get('program_name', 'Unknown Program'),
+            data.get('time_slot', ''),
+            data.get('author', ''),
+            data.get('description', ''),
+        )
 
     def clear_overlay(self):
         """Clear all overlay messages"""
-        if not OVERLAY_AVAILABLE or not self.overlay_client:
+        if not self._overlay_ok or self.overlay_client is None:
+            # Nothing can have been drawn if the client was never created
             return
-        
+
+        # Forget the last frame so the next update redraws everything
+        self._last_payload_hash = None
+        self._last_overlay_draw = 0
+
         try:
-            # Clear background shape
-            self.overlay_client.send_shape("radioprogram_bg", "rect", "#000000", "#000000", 0, 0, 1, 1, ttl=1)
-            
-            # Clear all overlay messages  
-            for i in range(20):  # Increased for more lines
-                self.overlay_client.send_message(f"radioprogram_{i}", "", "yellow", 0, 0, ttl=1)
+            # Clear the background shape plus only the slots that were
+            # drawn, in one batched write
+            messages = [{
+                "id": "radioprogram_bg",
+                "shape": "rect",
+                "color": "#000000",
+                "fill": "#000000",
+                "x": 0, "y": 0, "w": 1, "h": 1,
+                "ttl": 1
+            }]
+            messages.extend({
+                "id": f"radioprogram_{i}",
+                "text": "",
+                "color": "yellow",
+                "x": 0, "y": 0,
+                "ttl": 1
+            } for i in self._active_overlay_slots)
+            self._active_overlay_slots = set()
+            self._batch_send(messages)
         except Exception as e:
-            print(f"ED-RadioProgram: Error clearing overlay: {e}")
+            self._mark_overlay_dead(e)
 
-    def update_overlay(self):
+    def update_overlay(self, fields=None):
         """Update the overlay with current program data - Radio Station Styled"""
-        if not self.overlay_enabled or not OVERLAY_AVAILABLE or not self.overlay_client:
+        if not (self.overlay_enabled and self._overlay_ok):
             return
-        
+
+        if time.monotonic() < self._overlay_dead_until:
+            # Overlay went away recently; skip until the retry window
+            return
+
+        if self._get_overlay() is None:
+            return
+
         if not self.program_data or "error" in self.program_data:
             self.clear_overlay()
             return
-        
+
+        if fields is None:
+            fields = self._extract_fields(self.program_data)
+        program_name, time_slot, author, description = fields
+
+        # Bail out before any line assembly when the rendered inputs are
+        # unchanged and the last frame's TTL still covers the time until
+        # the next scheduled redraw
+        payload_hash = hash((fields, self.overlay_position, self.screen_width, self.screen_height))
+        if (payload_hash == self._last_payload_hash
+                and time.monotonic() - self._last_overlay_draw < self.refresh_interval * 60):
+            return
+
         try:
             # Calculate TTL: refresh interval + 1 minute buffer (in seconds)
             ttl_seconds = (self.refresh_interval + 1) * 60
             
-            # Get position percentages and convert to actual pixels based on resolution
-            pos_x_pct, pos_y_pct = OVERLAY_POSITIONS.get(self.overlay_position, OVERLAY_POSITIONS[DEFAULT_OVERLAY_POSITION])
-            overlay_x = int(pos_x_pct * self.screen_width)
-            overlay_y = int(pos_y_pct * self.screen_height)
-            
-            # Build styled overlay content
-            lines = []
-            colors = []
-            sizes = []
-            
-            # Top border
-            lines.append("╔════════════════════════════════════╗")
-            colors.append("#00FFFF")  # Cyan
-            sizes.append("normal")
+            # Get pixel geometry, memoized per (position, resolution)
+            layout = self._get_layout()
             
+            # Build styled overlay content as (text, color, size) entries
+            entries = [(_TOP_BORDER, *_STYLE_BORDER)]
+
             # Program name with music note icons (large, cyan)
-            program_name = self.program_data.get('program_name', 'Unknown Program')
-            wrapped_name = self._wrap_text(program_name, 32)
-            for name_line in wrapped_name:
-                lines.append(f"║ 🎵 {name_line}")
-                colors.append("#00FFFF")  # Cyan for station name
-                sizes.append("large")
-            
+            entries.extend((_PREFIX_NAME + name_line, *_STYLE_NAME)
+                           for name_line in self._wrap_text(program_name, 32))
+
             # Separator
-            lines.append("║────────────────────────────────────║")
-            colors.append("#00FFFF")
-            sizes.append("normal")
-            
+            entries.append((_SEPARATOR, *_STYLE_BORDER))
+
             # Time slot (green like digital clock)
-            time_slot = self.program_data.get('time_slot', '')
             if time_slot:
-                lines.append(f"║ ⏰ {time_slot}")
-                colors.append("#00FF00")  # Green
-                sizes.append("normal")
-            
+                entries.append((_PREFIX_TIME + time_slot, *_STYLE_TIME))
+
             # Presenter (orange, warm)
-            author = self.program_data.get('author', '')
             if author:
-                wrapped_author = self._wrap_text(author, 30)
-                for author_line in wrapped_author:
-                    lines.append(f"║ 🎙️ {author_line}")
-                    colors.append("#FFA500")  # Orange
-                    sizes.append("normal")
-            
+                entries.extend((_PREFIX_AUTHOR + author_line, *_STYLE_AUTHOR)
+                               for author_line in self._wrap_text(author, 30))
+
             # Separator before description
             if author or time_slot:
-                lines.append("║────────────────────────────────────║")
-                colors.append("#00FFFF")
-                sizes.append("normal")
-            
-            # Description (white, wrapped)
-            description = self.program_data.get('description', '')
-            if description:
-                wrapped_desc = self._wrap_text(description, 34)
-                for desc_line in wrapped_desc[:3]:  # Max 3 lines for description
-                    lines.append(f"║ {desc_line}")
-                    colors.append("#FFFFFF")  # White
-                    sizes.append("normal")
-                if len(wrapped_desc) > 3:
-                    lines.append("║ ...")
-                    colors.append("#FFFFFF")
-                    sizes.append("normal")
-            
+                entries.append((_SEPARATOR, *_STYLE_BORDER))
+
+            # Description (white, pre-wrapped at fetch time)
+            desc_lines = self.program_data.get('description_lines')
+            if desc_lines is None and description:
+                # Data didn't pass through _prepare_program_data; wrap now
+                desc_lines = self._wrap_text(description, 34)
+                if len(desc_lines) > 3:
+                    desc_lines = desc_lines[:3] + ["..."]
+            entries.extend((_PREFIX_PLAIN + desc_line, *_STYLE_DESC)
+                           for desc_line in desc_lines or [])
+
             # Bottom border
-            lines.append("╚════════════════════════════════════╝")
-            colors.append("#00FFFF")
-            sizes.append("normal")
-            
-            # Calculate box dimensions
-            box_width = 400  # Fixed width for consistent look
-            box_height = len(lines) * 18 + 20
-            
-            # Adjust position based on alignment
-            if "right" in self.overlay_position:
-                box_x = overlay_x - box_width
-                text_x = overlay_x - box_width + 10
-            elif "middle" in self.overlay_position and "left" not in self.overlay_position and "right" not in self.overlay_position:
-                box_x = overlay_x - (box_width // 2)
-                text_x = box_x + 10
-            else:
-                box_x = overlay_x
-                text_x = overlay_x + 10
-            
-            # Draw background box with transparency
-            try:
-                self.overlay_client.send_shape(
-                    "radioprogram_bg",
-                    "rect",
-                    "#000000",
-                    "rgba(0,0,0,0.7)",  # Slightly more opaque for better readability
-                    box_x,
-                    overlay_y,
-                    box_width,
-                    box_height,
-                    ttl=ttl_seconds
-                )
-            except Exception as e:
-                print(f"ED-RadioProgram: Could not draw background box: {e}")
-            
-            # Send styled text to overlay
-            y_offset = overlay_y + 5
-            for i, (line, color, size) in enumerate(zip(lines, colors, sizes)):
-                if i < 20:
-                    try:
-                        self.overlay_client.send_message(
-                            f"radioprogram_{i}",
-                            line,
-                            color,
-                            text_x,
-                            y_offset,
-                            ttl=ttl_seconds,
-                            size=size
-                        )
-                        y_offset += 22 if size == "large" else 18
-                    except Exception as e:
-                        print(f"ED-RadioProgram: Error sending line {i}: {e}")
-            
-            # Clear any remaining old lines
-            for i in range(len(lines), 20):
-                self.overlay_client.send_message(f"radioprogram_{i}", "", "#FFFFFF", 0, 0, ttl=1)
-                
+            entries.append((_BOTTOM_BORDER, *_STYLE_BORDER))
+
+            # Box height varies with the number of lines
+            box_height = len(entries) * 18 + 20
+
+            # Assemble the whole frame - background box with transparency,
+            # styled text lines and any leftover clears - then flush it
+            # in one batched write
+            messages = [{
+                "id": "radioprogram_bg",
+                "shape": "rect",
+                "color": "#000000",
+                "fill": "rgba(0,0,0,0.7)",  # Slightly more opaque for better readability
+                "x": layout.box_x,
+                "y": layout.overlay_y,
+                "w": _BOX_WIDTH,
+                "h": box_height,
+                "ttl": ttl_seconds
+            }]
+
+            y_offset = layout.overlay_y + 5
+            for i, (line, color, size) in enumerate(entries):
+                if i >= 20:
+                    break
+                messages.append({
+                    "id": f"radioprogram_{i}",
+                    "text": line,
+                    "color": color,
+                    "x": layout.text_x,
+                    "y": y_offset,
+                    "ttl": ttl_seconds,
+                    "size": size
+                })
+                y_offset += 22 if size == "large" else 18
+
+            # Clear only slots left over from a longer previous frame
+            used_slots = set(range(min(len(entries), 20)))
+            for i in self._active_overlay_slots - used_slots:
+                messages.append({
+                    "id": f"radioprogram_{i}",
+                    "text": "",
+                    "color": "#FFFFFF",
+                    "x": 0,
+                    "y": 0,
+                    "ttl": 1
+                })
+            self._active_overlay_slots = used_slots
+
+            self._batch_send(messages)
+
+            self._last_payload_hash = payload_hash
+            self._last_overlay_draw = time.monotonic()
+
         except Exception as e:
             print(f"ED-RadioProgram: Error updating overlay: {e}")
 
+    def _prepare_program_data(self, program_data):
+        """
+        Precompute the overlay's wrapped description lines once per fetch
+        instead of re-wrapping on every redraw.
+        """
+        if 'description_lines' in program_data:
+            # Parser memo handed back the same dict - already prepared
+            return program_data
+        description = program_data.get('description', '')
+        desc_lines = self._wrap_text(description, 34) if description else []
+        if len(desc_lines) > 3:
+            desc_lines = desc_lines[:3] + ["..."]
+        program_data['description_lines'] = desc_lines
+        return program_data
+
     def fetch_program_data(self):
         """Fetch program data from the radio station URL"""
         if not self.station_url:
             return {"error": "Station URL is required"}
         
-        if self.is_fetching:
+        # Non-blocking acquire: a second caller bails out instead of
+        # racing the in-flight fetch
+        if not self._fetch_lock.acquire(blocking=False):
             return {"error": "Already fetching data"}
-        
-        self.is_fetching = True
-        
+
         try:
-            # Fetch the API data
-            request = Request(
-                self.station_url,
-                headers={'User-Agent': 'ED-RadioProgram/1.0 (EDMC Plugin)'}
-            )
-            
-            response = urlopen(request, timeout=15)
-            json_content = response.read().decode('utf-8')
-            
-            self.is_fetching = False
-            
-            # Parse the content
-            program_data = self.parser.parse(json_content)
-            
+            # Send cache validators so an unchanged schedule comes back
+            # as a bodyless 304 instead of the full payload
+            headers = {}
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+
+            # Fetch the API data over the persistent session; short
+            # connect/read timeouts keep the worker from hanging on stalls
+            response = self._session.get(self.station_url, headers=headers, timeout=(3, 5))
+
+            if response.status_code == 304 and self._cached_payload:
+                # Schedule unchanged - re-parse the cached payload so the
+                # current broadcast still tracks the clock
+                program_data = self._get_parser().parse(self._cached_payload)
+                if not program_data:
+                    return {"error": "Could not parse program data"}
+                self._backoff = 0
+                return self._prepare_program_data(program_data)
+
+            response.raise_for_status()
+
+            # Parse the raw body - json.loads handles UTF-8 bytes
+            # directly, so skip the intermediate str copy of response.text
+            program_data = self._get_parser().parse(response.content)
+
             if not program_data:
                 return {"error": "Could not parse program data"}
-            
-            return program_data
-            
-        except HTTPError as e:
-            self.is_fetching = False
-            return {"error": f"HTTP Error {e.code}: {e.reason}"}
-        except URLError as e:
-            self.is_fetching = False
-            return {"error": f"Network Error: {str(e.reason)}"}
+
+            # Remember validators and payload for the next conditional GET
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            self._cached_payload = response.content
+
+            self._backoff = 0
+            return self._prepare_program_data(program_data)
+
+        except requests.HTTPError as e:
+            return {"error": f"HTTP Error {e.response.status_code}: {e.response.reason}"}
+        except requests.RequestException as e:
+            # Seeded below the shortest interval, doubled past the
+            # longest (60 min) so repeated failures actually stretch
+            # the schedule instead of being capped under it
+            self._backoff = min(self._backoff * 2, BACKOFF_CAP_SECONDS) if self._backoff else 30
+            return {"error": f"Network Error: {str(e)}"}
         except Exception as e:
-            self.is_fetching = False
             return {"error": f"Error: {str(e)}"}
+        finally:
+            self._fetch_lock.release()
+
+    def _set_label(self, label, **kwargs):
+        """
+        Apply label options only when they actually change.
+
+        The last options written to each label are kept on the Python
+        side, so on steady-state refreshes the unchanged case costs one
+        dict compare and never crosses into Tcl (not even for cget).
+        """
+        if label is None:
+            return
+        key = id(label)
+        if self._label_state.get(key) == kwargs:
+            return
+        label.config(**kwargs)
+        self._label_state[key] = kwargs
 
     def update_display(self):
         """Update the UI with current program data"""
-        # Update overlay if enabled
-        if self.overlay_enabled:
-            self.update_overlay()
-        
+        # Unpack the displayed fields once; overlay and labels share them
+        data = self.program_data
+        fields = None
+        if data and "error" not in data:
+            fields = self._extract_fields(data)
+
+        # Update overlay if enabled and usable
+        if self.overlay_enabled and self._overlay_ok:
+            self.update_overlay(fields)
+
         if not self.program_frame:
             return
-        
+
         # Check if it's an error
-        if self.program_data and "error" in self.program_data:
-            self._show_error(self.program_data['error'])
+        if data and "error" in data:
+            self._show_error(data['error'])
             return
-        
-        if not self.program_data:
+
+        if not data:
             self._show_no_data()
             return
-        
+
+        program_name, time_slot, author, description = fields
+
         # Update program name
-        program_name = self.program_data.get('program_name', 'Unknown Program')
-        if self.program_name_label:
-            self.program_name_label.config(text=program_name, fg="black")
-        
+        self._set_label(self.program_name_label, text=program_name, fg="black")
+
         # Update time slot
-        time_slot = self.program_data.get('time_slot', '')
-        if self.time_slot_label:
-            if time_slot:
-                self.time_slot_label.config(text=f"🕒 {time_slot}", fg="black")
-            else:
-                self.time_slot_label.config(text="")
-        
+        if time_slot:
+            self._set_label(self.time_slot_label, text=f"🕒 {time_slot}", fg="black")
+        else:
+            self._set_label(self.time_slot_label, text="")
+
         # Update description
-        description = self.program_data.get('description', '')
-        if self.description_label:
-            if description:
-                self.description_label.config(text=description, fg="black")
-            else:
-                self.description_label.config(text="")
-        
+        if description:
+            self._set_label(self.description_label, text=description, fg="black")
+        else:
+            self._set_label(self.description_label, text="")
+
         # Update author
-        author = self.program_data.get('author', '')
-        if self.author_label:
-            if author:
-                self.author_label.config(text=f"Presenter: {author}")
+        if author:
+            self._set_label(self.author_label, text=f"Presenter: {author}")
+        else:
+            self._set_label(self.author_label, text="")
+
+        # Update status; flag when the data on screen is stale because
+        # the latest refresh attempt failed
+        if self._last_update_str:
+            if self._fetch_error:
+                status = f"Last updated: {self._last_update_str} (refresh failed)"
             else:
-                self.author_label.config(text="")
-        
-        # Update status
-        if self.status_label and self.last_update:
-            time_str = self.last_update.strftime("%H:%M:%S")
-            self.status_label.config(text=f"Last updated: {time_str}")
+                status = f"Last updated: {self._last_update_str}"
+            self._set_label(self.status_label, text=status)
 
     def _show_error(self, error_msg):
         """Show error message in UI"""
-        if self.program_name_label:
-            self.program_name_label.config(text="Error", fg="red")
-        if self.time_slot_label:
-            self.time_slot_label.config(text="")
-        if self.description_label:
-            self.description_label.config(text=error_msg, fg="red")
-        if self.author_label:
-            self.author_label.config(text="")
-        if self.status_label:
-            self.status_label.config(text="Status: Error")
+        self._set_label(self.program_name_label, text="Error", fg="red")
+        self._set_label(self.time_slot_label, text="")
+        self._set_label(self.description_label, text=error_msg, fg="red")
+        self._set_label(self.author_label, text="")
+        self._set_label(self.status_label, text="Status: Error")
 
     def _show_no_data(self):
         """Show no data message in UI"""
-        if self.program_name_label:
-            self.program_name_label.config(text="No program data", fg="gray")
-        if self.time_slot_label:
-            self.time_slot_label.config(text="")
-        if self.description_label:
-            self.description_label.config(text="Waiting for data...", fg="gray")
-        if self.author_label:
-            self.author_label.config(text="")
-        if self.status_label:
-            self.status_label.config(text="Status: No data")
+        self._set_label(self.program_name_label, text="No program data", fg="gray")
+        self._set_label(self.time_slot_label, text="")
+        self._set_label(self.description_label, text="Waiting for data...", fg="gray")
+        self._set_label(self.author_label, text="")
+        self._set_label(self.status_label, text="Status: No data")
 
-    def fetch_and_update(self):
-        """Fetch data and update display (non-blocking)"""
-        def fetch_thread():
-            result = self.fetch_program_data()
+    def _fetch_job(self):
+        """Run one fetch on the executor thread and hand off to the UI"""
+        self._fetch_pending = False
+        result = self.fetch_program_data()
+        if "error" not in result:
             self.program_data = result
+            self._cache_ts = time.monotonic()
+            self._fetch_error = None
             self.last_update = datetime.now()
-            
-            # Schedule UI update on main thread
-            if self.parent:
-                self.parent.after(0, self.update_display)
-        
-        thread = Thread(target=fetch_thread)
-        thread.daemon = True
-        thread.start()
+            # Format once here; update_display reuses the string
+            self._last_update_str = self.last_update.strftime("%H:%M:%S")
+        elif self.program_data and "error" not in self.program_data:
+            # Transient failure: keep the last good data on screen
+            # and only surface the problem in the status line
+            self._fetch_error = result["error"]
+        else:
+            self.program_data = result
+            self._fetch_error = result["error"]
+
+        # Schedule UI update on main thread; after_idle dispatches
+        # on the next idle pass without going through the timer queue
+        if self.parent:
+            self.parent.after_idle(self.update_display)
+
+    def fetch_and_update(self):
+        """Submit a fetch to the worker executor (non-blocking)"""
+        # Data fetched moments ago is still fresh; just redisplay it
+        if self._cache_ts and time.monotonic() - self._cache_ts < STALE_AFTER_SECONDS:
+            self.update_display()
+            return
+
+        # One queued refresh is enough; extra clicks would just repeat it
+        if self._fetch_pending:
+            return
+        self._fetch_pending = True
+        self._executor.submit(self._fetch_job)
 
     def manual_refresh(self):
         """Handle manual refresh button click"""
-        if self.status_label:
-            self.status_label.config(text="Status: Refreshing...")
+        self._set_label(self.status_label, text="Status: Refreshing...")
         self.fetch_and_update()
 
     def schedule_refresh(self):
@@ -503,20 +861,64 @@ class RadioProgramPlugin:
         if self.station_url:
             self.fetch_and_update()
         
-        # Schedule next refresh (convert minutes to milliseconds)
+        # Schedule the next refresh against a monotonic target time,
+        # stretched by the current backoff after network failures. If the
+        # machine slept through one or more windows, they coalesce into a
+        # single wake-up instead of a burst of queued callbacks.
         if self.parent and self.refresh_interval > 0:
-            interval_ms = self.refresh_interval * 60 * 1000
-            self.refresh_timer = self.parent.after(interval_ms, self.schedule_refresh)
+            if self.refresh_timer:
+                self.parent.after_cancel(self.refresh_timer)
+            interval = max(self.refresh_interval * 60, self._backoff)
+            now = time.monotonic()
+            self._next_refresh_monotonic += interval
+            if self._next_refresh_monotonic <= now:
+                self._next_refresh_monotonic = now + interval
+            delay_ms = max(0, int((self._next_refresh_monotonic - now) * 1000))
+            self.refresh_timer = self.parent.after(delay_ms, self.schedule_refresh)
+
+    def _on_unmap(self, event):
+        """Pause refreshes while the EDMC window is hidden/minimized"""
+        # Child widgets also fire through the toplevel's bindtag; only
+        # the toplevel being unmapped means the window was hidden
+        if event.widget is not self._toplevel or self._paused:
+            return
+        self._paused = True
+        if self.refresh_timer and self.parent:
+            self.parent.after_cancel(self.refresh_timer)
+            self.refresh_timer = None
+
+    def _on_map(self, event):
+        """Resume refreshes when the EDMC window becomes visible again"""
+        if event.widget is not self._toplevel or not self._paused:
+            return
+        self._paused = False
+        self.schedule_refresh()
 
     def stop_refresh(self):
         """Stop automatic refresh timer"""
         if self.refresh_timer and self.parent:
             self.parent.after_cancel(self.refresh_timer)
             self.refresh_timer = None
-        
+        # A restart queued by the config-save debounce would re-arm the
+        # timer after this stop; drop it too
+        if self._restart_timer and self.parent:
+            self.parent.after_cancel(self._restart_timer)
+            self._restart_timer = None
+        self._next_refresh_monotonic = 0.0
+
         # Clear overlay on stop
         self.clear_overlay()
 
+    def close(self):
+        """Stop the fetch worker and release network resources"""
+        self._fetch_pending = False
+        # Cancel any refresh still queued; don't wait on an in-flight one
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
 
 def plugin_start3(plugin_dir):
     """Plugin start for Python 3"""
@@ -535,6 +937,7 @@ def plugin_stop():
     """Clean up when plugin stops"""
     if hasattr(this, 'plugin') and this.plugin:
         this.plugin.stop_refresh()
+        this.plugin.close()
 
 
 def plugin_app(parent):
@@ -604,7 +1007,7 @@ def plugin_app(parent):
     plugin.refresh_button.pack(side=tk.LEFT, padx=2)
     
     # Overlay toggle button (only if overlay is available)
-    if OVERLAY_AVAILABLE and plugin.overlay_client:
+    if OVERLAY_AVAILABLE and plugin._overlay_ok:
         overlay_text = "Hide Overlay" if plugin.overlay_enabled else "Show Overlay"
         plugin.overlay_button = tk.Button(
             button_frame,
@@ -622,6 +1025,15 @@ def plugin_app(parent):
     )
     plugin.status_label.grid(row=2, column=0, sticky=tk.W, padx=5)
     
+    # Pause refreshes while the window is hidden. Minimizing unmaps the
+    # toplevel window, not this frame, so bind there; guard against
+    # re-binding if plugin_app is ever called again
+    if not plugin._visibility_bound:
+        plugin._toplevel = parent.winfo_toplevel()
+        plugin._toplevel.bind('<Unmap>', plugin._on_unmap, add='+')
+        plugin._toplevel.bind('<Map>', plugin._on_map, add='+')
+        plugin._visibility_bound = True
+
     # Start automatic refresh
     plugin.schedule_refresh()
     
@@ -816,22 +1228,10 @@ def plugin_prefs(parent, cmdr, is_beta):
             position_label = tk.Label(frame, text="Overlay Position:")
         position_label.grid(row=row, column=0, sticky=tk.W, padx=10)
         
-        # Create human-readable position names
-        position_names = {
-            "top-left": "Top Left",
-            "top-middle": "Top Middle",
-            "top-right": "Top Right",
-            "middle-left": "Middle Left",
-            "middle-right": "Middle Right",
-            "bottom-left": "Bottom Left",
-            "bottom-middle": "Bottom Middle",
-            "bottom-right": "Bottom Right"
-        }
-        
         this.overlay_position_var = tk.StringVar(value=plugin.overlay_position)
-        position_values = list(OVERLAY_POSITIONS.keys())
-        position_display = [position_names.get(p, p) for p in position_values]
-        
+        position_values = _POSITION_VALUES
+        position_display = _POSITION_DISPLAY
+
         if nb:
             position_combo = ttk.Combobox(
                 frame,
@@ -871,6 +1271,22 @@ def plugin_prefs(parent, cmdr, is_beta):
     return frame
 
 
+def _valid_interval(value):
+    """Refresh interval bounds check for the preference field table"""
+    return value if 5 <= value <= 60 else None
+
+
+# Simple preference fields applied in one pass by prefs_changed:
+# (tk variable name on `this`, plugin attribute, validator). The
+# validator returns the value to store, or None to leave the attribute
+# untouched
+_PREF_FIELDS = (
+    ('station_url_var', 'station_url', str),
+    ('station_type_var', 'station_type', str),
+    ('refresh_interval_var', 'refresh_interval', _valid_interval),
+)
+
+
 def prefs_changed(cmdr, is_beta):
     """Handle preference changes"""
     if not hasattr(this, 'plugin'):
@@ -878,20 +1294,22 @@ def prefs_changed(cmdr, is_beta):
     
     plugin = this.plugin
     
-    # Update configuration
-    if hasattr(this, 'station_url_var'):
-        plugin.station_url = this.station_url_var.get()
-    
-    if hasattr(this, 'station_type_var'):
-        plugin.station_type = this.station_type_var.get()
-    
-    if hasattr(this, 'refresh_interval_var'):
+    # Apply the plain value fields from the table
+    old_station_type = plugin.station_type
+    for var_name, attr, validate in _PREF_FIELDS:
+        var = getattr(this, var_name, None)
+        if var is None:
+            continue
         try:
-            interval = this.refresh_interval_var.get()
-            if 5 <= interval <= 60:
-                plugin.refresh_interval = interval
-        except:
-            pass
+            value = validate(var.get())
+        except Exception:
+            continue
+        if value is not None:
+            setattr(plugin, attr, value)
+
+    if plugin.station_type != old_station_type:
+        # Next fetch re-resolves the parser for the new station type
+        plugin.parser = None
     
     # Update screen resolution
     if hasattr(this, 'screen_resolution_var'):
@@ -934,13 +1352,12 @@ def prefs_changed(cmdr, is_beta):
         if new_position in OVERLAY_POSITIONS:
             old_position = plugin.overlay_position
             plugin.overlay_position = new_position
-            
+            plugin._rebuild_position_cache()
+
             # If position changed and overlay is enabled, refresh it
             if old_position != new_position and plugin.overlay_enabled:
                 plugin.update_overlay()
     
+    # Saving reschedules the refresh timer (debounced) if the interval
+    # or station URL actually changed
     plugin.save_config()
-    
-    # Restart refresh timer with new interval
-    plugin.stop_refresh()
-    plugin.schedule_refresh()
@@ -2,60 +2,184 @@
 Parser for ORF Sound radio station JSON API
 """
 
-import json
+import logging
 import re
-from datetime import datetime
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from html import unescape
 from .base_parser import BaseParser
 
+# orjson decodes the multi-KB broadcast payload several times faster
+# than the stdlib and accepts bytes directly; ujson is a decent second
+# choice before falling back to the stdlib
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+
+_log = logging.getLogger(__name__)
+
+# Compiled once instead of per call
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+@lru_cache(maxsize=64)
+def _clean_html(text):
+    """
+    Clean HTML tags and entities from text.
+
+    Cached because consecutive refreshes within one program slot hand in
+    the same subtitle string over and over.
+
+    Args:
+        text (str): Text with potential HTML
+
+    Returns:
+        str: Cleaned text
+    """
+    if not text:
+        return ""
+
+    # Most subtitles are plain text; two C-level membership checks skip
+    # the regex and entity machinery for those
+    if '<' not in text and '&' not in text:
+        return ' '.join(text.split())
+
+    # Remove HTML tags
+    text = _TAG_RE.sub('', text)
+
+    # Decode HTML entities - html.unescape covers every named and
+    # numeric entity (the old table missed e.g. &auml;, common in
+    # German subtitles) and only copies when an entity is present
+    text = unescape(text)
+
+    # Remove extra whitespace
+    return ' '.join(text.split())
+
 
 class ORFParser(BaseParser):
     """
     Parser for ORF Sound radio stations (e.g., Ö1, FM4, etc.)
     Fetches current program information from ORF AudioAPI JSON endpoint
     """
-    
+
+    # Set True to get full tracebacks on parse failures; off by default
+    # so a feed that is malformed for a while doesn't spam stderr on
+    # every refresh tick
+    _debug = False
+
     def __init__(self):
         super().__init__()
+        # Last successful parse, reused as long as the broadcast it
+        # matched is still on air - the overwhelmingly common case from
+        # one refresh tick to the next - skipping JSON decode and search
+        self._last_result = None
+        self._last_start_ms = 0
+        self._last_end_ms = 0
+        # Flattened search arrays keyed by payload hash, so an unchanged
+        # feed is decoded and flattened once and later parses only redo
+        # the bisect
+        self._flat_hash = None
+        self._flat_broadcasts = None
+        self._flat_starts = None
+        self._flat_ends = None
     
     def parse(self, json_content):
         """
         Parse ORF AudioAPI JSON content and extract current program information.
-        
+
         Args:
-            json_content (str): Raw JSON string from ORF AudioAPI
-            
+            json_content (str | bytes | list): Raw JSON payload from the
+                ORF AudioAPI, or the already-decoded day list if the
+                caller decoded it once and shares the object
+
         Returns:
             dict: Program information or None if parsing fails
         """
         try:
-            # Parse JSON
-            data = json.loads(json_content)
-            
-            if not isinstance(data, list) or len(data) == 0:
-                return None
-            
-            # Get current timestamp in milliseconds
-            current_time_ms = int(datetime.now().timestamp() * 1000)
-            
-            # Search through all days and broadcasts to find the current one
+            # Get current timestamp in milliseconds - time_ns is a
+            # plain integer clock read with no datetime allocation
+            current_time_ms = time.time_ns() // 1_000_000
+
+            # An already-decoded list can't be hashed for the memo or
+            # the flattened cache; it skips straight to flattening below
+            payload_hash = None if isinstance(json_content, list) \
+                else hash(json_content)
+
+            # The memo only holds for the same payload: a changed feed
+            # (different station URL, mid-broadcast correction) must be
+            # re-parsed even while the old broadcast is still on air
+            if (self._last_result is not None
+                    and payload_hash is not None
+                    and payload_hash == self._flat_hash
+                    and self._last_start_ms <= current_time_ms <= self._last_end_ms):
+                return self._last_result
+
             current_broadcast = None
-            
-            for day_data in data:
-                if 'broadcasts' not in day_data:
-                    continue
-                
-                for broadcast in day_data['broadcasts']:
-                    start_time = broadcast.get('start', 0)
-                    end_time = broadcast.get('end', 0)
-                    
-                    # Check if current time falls within this broadcast
-                    if start_time <= current_time_ms <= end_time:
-                        current_broadcast = broadcast
-                        break
-                
-                if current_broadcast:
-                    break
-            
+            idx = -1
+
+            if payload_hash is not None and payload_hash == self._flat_hash:
+                # Same payload as the last decode - reuse the flattened
+                # arrays and only redo the bisect
+                broadcasts = self._flat_broadcasts
+                starts = self._flat_starts
+                ends = self._flat_ends
+                idx = bisect_right(starts, current_time_ms) - 1
+                if idx >= 0 and ends[idx] >= current_time_ms:
+                    current_broadcast = broadcasts[idx]
+
+            if current_broadcast is None:
+                # Parse JSON unless the caller already did. Also taken
+                # on a cached-array miss (e.g. midnight rolled past the
+                # pruned day) so the arrays are rebuilt around "now"
+                if payload_hash is None:
+                    data = json_content
+                else:
+                    data = _json_loads(json_content)
+
+                if not isinstance(data, list) or len(data) == 0:
+                    return None
+
+                # The feed carries about a week of schedule but only one day
+                # can bracket "now"; an O(1) check against each day's first
+                # and last broadcast drops the rest before any flattening
+                broadcasts = []
+                for day_data in data:
+                    day_bcs = day_data.get('broadcasts')
+                    if (day_bcs
+                            and day_bcs[0].get('start', 0) <= current_time_ms
+                            and current_time_ms <= day_bcs[-1].get('end', 0)):
+                        broadcasts.extend(day_bcs)
+
+                # Broadcasts are time-ordered, so binary-search the start
+                # times instead of scanning every broadcast. The parallel
+                # start/end arrays are built in one pass and indexed plainly
+                # afterwards, keeping dict lookups out of the search itself
+                starts = []
+                ends = []
+                for b in broadcasts:
+                    starts.append(b.get('start', 0))
+                    ends.append(b.get('end', 0))
+
+                # Only the bracketing day's broadcasts stay referenced;
+                # dropping the decoded tree here lets the other days be
+                # collected instead of living until the end of parse
+                del data
+
+                if payload_hash is not None:
+                    self._flat_hash = payload_hash
+                    self._flat_broadcasts = broadcasts
+                    self._flat_starts = starts
+                    self._flat_ends = ends
+
+                idx = bisect_right(starts, current_time_ms) - 1
+                if idx >= 0 and ends[idx] >= current_time_ms:
+                    current_broadcast = broadcasts[idx]
+
             if not current_broadcast:
                 # No current broadcast found, return None
                 return None
@@ -85,14 +209,12 @@ class ORFParser(BaseParser):
             start_iso = current_broadcast.get('startISO', '')
             end_iso = current_broadcast.get('endISO', '')
             
-            if start_iso and end_iso:
-                try:
-                    # Parse ISO datetime and format as HH:MM
-                    start_dt = datetime.fromisoformat(start_iso.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end_iso.replace('Z', '+00:00'))
-                    program_data['time_slot'] = f"{start_dt.strftime('%H:%M')} - {end_dt.strftime('%H:%M')} Uhr"
-                except:
-                    pass
+            if len(start_iso) >= 16 and len(end_iso) >= 16:
+                # "YYYY-MM-DDTHH:MM..." - HH:MM sits at a fixed offset,
+                # so slice it out instead of building datetime objects
+                # just to strftime them back. The API reports local
+                # Austrian time, so no timezone conversion is needed
+                program_data['time_slot'] = f"{start_iso[11:16]} - {end_iso[11:16]} Uhr"
             
             # Description - from subtitle field (may contain HTML)
             subtitle = current_broadcast.get('subtitle', '')
@@ -110,39 +232,18 @@ class ORFParser(BaseParser):
             # Author/presenter - not directly available in this API
             # Would need to parse from subtitle or fetch detail URL
             
+            self._last_result = program_data
+            self._last_start_ms = starts[idx]
+            self._last_end_ms = ends[idx]
             return program_data
             
         except Exception as e:
-            print(f"ORFParser error: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.warning("ORFParser error: %s", e)
+            if self._debug:
+                import traceback
+                traceback.print_exc()
             return None
     
     def _clean_html(self, text):
-        """
-        Clean HTML tags and entities from text.
-        
-        Args:
-            text (str): Text with potential HTML
-            
-        Returns:
-            str: Cleaned text
-        """
-        if not text:
-            return ""
-        
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Decode HTML entities
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
-        text = text.replace('&nbsp;', ' ')
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text.strip()
+        """Clean HTML tags and entities from text (cached module helper)"""
+        return _clean_html(text)